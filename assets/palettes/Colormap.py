@@ -2,6 +2,7 @@
 @Author: Foad Alhayek
 @Description: Colormap with distinguishable colors. Inspired from matplotlib e.g., Set3 and tab10 colormaps.
 """
+import sys
 from PySide6.QtGui import QColor
 from collections import deque
 
@@ -32,21 +33,25 @@ class Colormap:
             "#aec7e8", "#ffbb78", "#98df8a", "#ff9896", "#c5b0d5", "#c49c94", "#f7b6d2", "#c7c7c7", "#dbdb8d", "#9edae5"
         ]
     }
+    _NAMES = tuple(COLORMAPS.keys())
+
+    # Shared QColor instances keyed by hex, avoids re-parsing the hex string on every lookup (Flyweight)
+    _QCOLOR_CACHE: dict[str, QColor] = {}
 
     def __init__(self, colormap_name: str = "tab10"):
         """ Initialize a colormap cycle for a specific colormap: Available: tab10, set3, tab20, fof20 """
         if colormap_name not in self.COLORMAPS:
-            raise ValueError(f"Colormap '{colormap_name}' is not available. Choose from {list(self.COLORMAPS.keys())}")
+            raise ValueError(f"Colormap '{colormap_name}' is not available. Choose from {list(self._NAMES)}")
 
         self.colormap_name = colormap_name
-        self.all_colors = tuple(self.COLORMAPS[colormap_name])
+        self.all_colors = self.COLORMAPS[colormap_name]
         self.available_colors = deque(self.all_colors)
         self.colors_in_use_by_item = dict()
 
     def get_color(self, item_id) -> QColor:
         """ Returns the next available color from the selected colormap as a QColor object. """
         if item_id in self.colors_in_use_by_item:
-            return QColor(self.colors_in_use_by_item[item_id])
+            return self._qcolor(self.colors_in_use_by_item[item_id])
 
         # Either pick from available colors or cycle if no new colors exists
         if self.available_colors:
@@ -57,7 +62,17 @@ class Colormap:
 
         # Track and return color
         self.colors_in_use_by_item[item_id] = color
-        return QColor(color)
+        return self._qcolor(color)
+
+    @classmethod
+    def _qcolor(cls, hex_color: str) -> QColor:
+        """ Returns the shared QColor for the hex color. Copy it with QColor(color) before mutating it. """
+        qcolor = cls._QCOLOR_CACHE.get(hex_color)
+        if qcolor is None:
+            # All colormap entries are "#rrggbb", build from the packed ARGB int to skip Qt's named-color parser
+            qcolor = QColor.fromRgba(0xFF000000 | int(hex_color[1:], 16))
+            cls._QCOLOR_CACHE[hex_color] = qcolor
+        return qcolor
 
     def release_color(self, item_id):
         """ Releases the color and returns it to the pool of available colors. """
@@ -67,21 +82,32 @@ class Colormap:
 
     def reset(self):
         """ Resets the colormap cycle to the beginning. """
-        self.available_colors = deque(self.all_colors)
-        self.colors_in_use_by_item = dict()
+        # Reuse the existing containers instead of allocating new ones
+        self.available_colors.clear()
+        self.available_colors.extend(self.all_colors)
+        self.colors_in_use_by_item.clear()
 
     def set_colormap(self, colormap_name: str):
         """ Changes the colormap dynamically and resets the cycle. """
         if colormap_name not in self.COLORMAPS:
-            raise ValueError(f"Colormap '{colormap_name}' is not available. Choose from {list(self.COLORMAPS.keys())}")
+            raise ValueError(f"Colormap '{colormap_name}' is not available. Choose from {list(self._NAMES)}")
 
         self.colormap_name = colormap_name
-        self.all_colors = tuple(self.COLORMAPS[colormap_name])
+        self.all_colors = self.COLORMAPS[colormap_name]
         self.reset()
 
     def available_cm(self):
         """ Returns available colormap names in a list. """
-        return list(self.COLORMAPS.keys())
+        return list(self._NAMES)
+
+
+# Store the colormaps as tuples of interned strings so dict/deque comparisons of colors are mostly identity checks
+Colormap.COLORMAPS = {name: tuple(sys.intern(c) for c in colors) for name, colors in Colormap.COLORMAPS.items()}
+
+# Pre-populate the QColor cache so the first paint does not pay the parse cost
+for _colors in Colormap.COLORMAPS.values():
+    for _hex_color in _colors:
+        Colormap._qcolor(_hex_color)
 
 if __name__ == "__main__":
     pass
\ No newline at end of file
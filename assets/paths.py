@@ -0,0 +1,13 @@
+"""
+Paths shared by the application.
+
+Usage: QuadView.py
+"""
+import sys
+import pathlib
+
+# Get the path to the folder containing the running script (required for exe to work properly)
+if getattr(sys, 'frozen', False):
+    APP_PATH = pathlib.Path(sys._MEIPASS)  # noqa
+else:
+    APP_PATH = pathlib.Path(__file__).parent.parent
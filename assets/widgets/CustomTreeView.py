@@ -18,13 +18,14 @@ class CustomTreeView(QTreeView):
 
     def mouseDoubleClickEvent(self, event):
         """ Adds custom right double click event. """
-        index = self.indexAt(event.pos())
+        # Only hit-test for the right button, the base class already resolves (and validates) the index otherwise
+        if event.button() == Qt.MouseButton.RightButton:
+            index = self.indexAt(event.pos())
 
-        if not index.isValid():
-            event.ignore()
+            if index.isValid():
+                self.rightDoubleClicked.emit(index)
+            else:
+                event.ignore()
             return
 
-        if event.button() == Qt.MouseButton.RightButton:
-            self.rightDoubleClicked.emit(index)
-        else:
-            super().mouseDoubleClickEvent(event)
\ No newline at end of file
+        super().mouseDoubleClickEvent(event)
\ No newline at end of file
@@ -8,11 +8,34 @@ from PySide6.QtGui import QIcon, QDoubleValidator
 from PySide6.QtCore import QSize, QLocale, Signal
 
 class DotOnlyDoubleValidator(QDoubleValidator):
-    """ Inherits from QDoubleValidator and serves as a stricter version by not allowing commas as visual separators. """
+    """
+    Inherits from QDoubleValidator and serves as a stricter version by not allowing commas as visual separators.
+    The state of recently validated strings is cached, so configure the validator (notation, locale, decimals etc.)
+    before it is used.
+    """
+    max_cache_size = 128
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = {}
+
     def validate(self, input_str: str, pos: int):
+        state = self._cache.get(input_str)
+        if state is not None:
+            return state, input_str, pos
+
         if "," in input_str:
-            return QDoubleValidator.State.Invalid, input_str, pos
-        return super().validate(input_str, pos)
+            state = QDoubleValidator.State.Invalid
+        else:
+            state, input_str, pos = super().validate(input_str, pos)
+
+        # Keep the cache small, e.g., when a user pastes a lot of different values
+        if len(self._cache) >= self.max_cache_size:
+            self._cache.clear()
+        self._cache[input_str] = state
+
+        return state, input_str, pos
+
 
 class FloatInputWidget(QWidget):
     """
@@ -27,6 +50,24 @@ class FloatInputWidget(QWidget):
     value_submitted = Signal(float)
     button_clicked = Signal()
 
+    # Button stylesheet, {pad} is the padding used to animate the button on press
+    _BUTTON_QSS_TEMPLATE = '''
+        QToolButton {{
+          padding: 0px;
+          border-width: 1px 1px 1px 0px;
+          border-style: solid;
+          border-color: #dcdcdc;
+          border-bottom-color: #808080;
+          border-top-right-radius: 5px;
+          border-bottom-right-radius: 5px;
+          background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
+        }}
+        QToolButton:pressed {{
+          background: #e1e1e1;
+          padding: {pad}px;
+        }}
+    '''
+
     def __init__(self, icon: QIcon, placeholder_text: str="", parent=None):
         """
         :param icon: Icon displayed on the button.
@@ -37,6 +78,8 @@ class FloatInputWidget(QWidget):
         # Class settings
         self.min_width = 148
         self.min_height = 20
+        self._last_size = None
+        self._last_submit = ("", 0.0)
         self.setMinimumSize(self.min_width, self.min_height)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
@@ -45,7 +88,7 @@ class FloatInputWidget(QWidget):
         self.button = QToolButton(self)
 
         # Validator settings
-        self.validator = DotOnlyDoubleValidator()
+        self.validator = DotOnlyDoubleValidator(self)
         self.validator.setNotation(DotOnlyDoubleValidator.Notation.StandardNotation)
         self.validator.setLocale(QLocale(QLocale.Language.C))
         self.validator.setDecimals(9)
@@ -77,26 +120,19 @@ class FloatInputWidget(QWidget):
         ''')
 
         self.button.setIcon(icon)
-        self.button.setStyleSheet('''
-            QToolButton {
-              padding: 0px;
-              border-width: 1px 1px 1px 0px;
-              border-style: solid;
-              border-color: #dcdcdc;
-              border-bottom-color: #808080;
-              border-top-right-radius: 5px;
-              border-bottom-right-radius: 5px;
-              background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
-            }
-            QToolButton:pressed {
-              background: #e1e1e1;
-            }
-        ''')
+        self._last_pad = 0
+        self.button.setStyleSheet(self._BUTTON_QSS_TEMPLATE.format(pad=self._last_pad))
 
     def set_placeholder_text(self, text):
         self.lineEdit.setPlaceholderText(text)
 
     def set_size(self, width, height):
+        # Qt fires resize events without an actual size change (e.g., during layout polishing), skip those
+        size_key = (width, height, self.min_width, self.min_height)
+        if size_key == self._last_size:
+            return
+        self._last_size = size_key
+
         if width - height < self.min_width - self.min_height:
             height = width - self.min_width
 
@@ -110,23 +146,11 @@ class FloatInputWidget(QWidget):
         self.button.setGeometry(line_width, 0, height, height)
         self.button.setIconSize(QSize(height // 2, height // 2))
 
-        # Animates the button on press
-        self.button.setStyleSheet('''
-            QToolButton {
-              padding: 0px;
-              border-width: 1px 1px 1px 0px;
-              border-style: solid;
-              border-color: #dcdcdc;
-              border-bottom-color: #808080;
-              border-top-right-radius: 5px;
-              border-bottom-right-radius: 5px;
-              background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
-            }
-            QToolButton:pressed {
-              background: #e1e1e1;
-              padding:''' + str(height // 4) + '''px;
-            }
-        ''')
+        # Animates the button on press, only re-set the stylesheet when the padding changes as Qt re-parses it
+        pad = height // 4
+        if pad != self._last_pad:
+            self.button.setStyleSheet(self._BUTTON_QSS_TEMPLATE.format(pad=pad))
+            self._last_pad = pad
 
     def sizeHint(self, /):
         return QSize(self.min_width, self.min_height)
@@ -146,15 +170,24 @@ class FloatInputWidget(QWidget):
 
     def _submit(self):
         """ Called when the user submits the input. """
-        text = self.lineEdit.text().strip()
-        text = self.validator.fixup(text)
-
-        try:
-            value = float(text)
-        except ValueError:
+        text = self.lineEdit.text()
+        if not text or text.isspace():
             self.lineEdit.clear()
             return
 
+        if text[0].isspace() or text[-1].isspace():
+            text = text.strip()
+
+        # Re-submitting the same text does not need to be parsed again
+        last_text, value = self._last_submit
+        if text != last_text:
+            try:
+                value = float(self.validator.fixup(text))
+            except ValueError:
+                self.lineEdit.clear()
+                return
+            self._last_submit = (text, value)
+
         self.value_submitted.emit(value)
         self.lineEdit.clear()
 
@@ -5,10 +5,11 @@
 import pathlib
 from PySide6.QtWidgets import QFileDialog
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QSettings
 
 # Internal imports
 from assets.widgets.StandardToolButton import StandardToolButton
+from assets.widgets.dialog_settings import SETTINGS_ORGANIZATION, SETTINGS_APPLICATION, LAST_DIR_KEY
 
 class ImportFileButton(StandardToolButton):
     """
@@ -31,7 +32,7 @@ class ImportFileButton(StandardToolButton):
         :param file_ext_filter: File extension filter for the file dialog.
         :param icon: Icon displayed on the button.
         :param caption: Caption displayed on the file dialog.
-        :param initial_dir: Initial directory of the file dialog.
+        :param initial_dir: Initial directory of the file dialog, if empty the last used directory is used.
         :param parent: Parent widget of the button.
         """
         super().__init__(icon, parent)
@@ -46,18 +47,17 @@ class ImportFileButton(StandardToolButton):
 
     def open_file_dialog(self):
         """ Opens the file dialog when the button is clicked and emits with the selected file path. """
-        try:
-            filepath, _ = QFileDialog.getOpenFileName(self,
-                                                      caption=self.caption,
-                                                      dir=self.initial_dir,
-                                                      filter=self.file_ext_filter)
-
-            # If Cancel or X is clicked, don't do anything
-            if filepath != "":
-                selected_file = pathlib.Path(filepath)
-                self.file_selected.emit(selected_file)
-        except Exception as e:
-            print(f"An error occurred: {e}")
+        settings = QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+        filepath, _ = QFileDialog.getOpenFileName(self,
+                                                  caption=self.caption,
+                                                  dir=self.initial_dir or settings.value(LAST_DIR_KEY, ""),
+                                                  filter=self.file_ext_filter)
+
+        # If Cancel or X is clicked, an empty string is returned (no exception is raised), don't do anything
+        if filepath:
+            selected_file = pathlib.Path(filepath)
+            settings.setValue(LAST_DIR_KEY, str(selected_file.parent))
+            self.file_selected.emit(selected_file)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,22 @@ from PySide6.QtCore import QSize
 
 class StandardToolButton(QToolButton):
     """ A commonly styled QToolButton that handles icon resizing, wrapped into a class for consistency. """
+    # Stylesheet, {pad} is the padding used to animate the button on press
+    _QSS_TEMPLATE = '''
+        QToolButton {{
+          padding: 0px;
+          border-width: 1px;
+          border-style: solid;
+          border-color: black;
+          border-radius: 6px;
+          background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
+        }}
+        QToolButton:pressed {{
+          background: #e1e1e1;
+          padding: {pad}px;
+        }}
+    '''
+
     def __init__(self, icon: QIcon, parent=None):
         """
         :param icon: Icon displayed on the button.
@@ -18,41 +34,19 @@ class StandardToolButton(QToolButton):
 
         # Style
         self.setIcon(icon)
-        self.setStyleSheet('''
-            QToolButton {
-              padding: 0px;
-              border-width: 1px;
-              border-style: solid;
-              border-color: black;
-              border-radius: 6px;
-              background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
-            }
-            QToolButton:pressed {
-              background: #e1e1e1;
-            }
-        ''')
+        self._last_pad = 0
+        self.setStyleSheet(self._QSS_TEMPLATE.format(pad=self._last_pad))
 
     def set_size(self, width, height):
         """ Updates the size of the widget by making sure the widget and icon are proportional and animation works """
         self.setFixedSize(width, height)
         self.setIconSize(QSize(height//2, height//2))
 
-        stylesheet = '''
-        QToolButton {
-          padding: 0px;
-          border-width: 1px;
-          border-style: solid;
-          border-color: black;
-          border-radius: 6px;
-          background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
-        }
-        QToolButton:pressed {
-          background: #e1e1e1;
-          padding:''' + str(height//4) + '''px;
-        }
-        '''
-
-        self.setStyleSheet(stylesheet)
+        # Only re-set the stylesheet when the padding changes as Qt re-parses and re-polishes on every call
+        pad = height // 4
+        if pad != self._last_pad:
+            self.setStyleSheet(self._QSS_TEMPLATE.format(pad=pad))
+            self._last_pad = pad
 
         # Update the changes
         self.adjustSize()
@@ -2,14 +2,53 @@
 @Author: Foad Alhayek
 @Description: A custom button widget that includes a display showcasing the name of the file that has been chosen.
 """
-import sys
 import pathlib
 from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QLabel, QPushButton, QSizePolicy, QFileDialog
-from PySide6.QtGui import QIcon
-from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import QSize, QSettings, QByteArray
+
+# Internal imports
+from assets.widgets.dialog_settings import SETTINGS_ORGANIZATION, SETTINGS_APPLICATION, LAST_DIR_KEY
+
+# Embedded copy of assets/icons/three_dots.svg (rendered at 64px), skips the disk read and works for the exe as well
+THREE_DOTS_SVG = QByteArray(
+    b'<svg xmlns="http://www.w3.org/2000/svg" height="64px" viewBox="0 -960 960 960" width="64px" fill="#5f6368">'
+    b'<path d="M240-400q-33 0-56.5-23.5T160-480q0-33 23.5-56.5T240-560q33 0 56.5 23.5T320-480q0 33-23.5 '
+    b'56.5T240-400Zm240 0q-33 0-56.5-23.5T400-480q0-33 23.5-56.5T480-560q33 0 56.5 23.5T560-480q0 33-23.5 '
+    b'56.5T480-400Zm240 0q-33 0-56.5-23.5T640-480q0-33 23.5-56.5T720-560q33 0 56.5 23.5T800-480q0 33-23.5 '
+    b'56.5T720-400Z"/></svg>'
+)
 
 
 class TextBoxWithButton(QWidget):
+    _icon: QIcon | None = None
+
+    # Base button stylesheet, set_size appends the pressed padding used to animate the button
+    _BUTTON_QSS = '''
+        QPushButton {
+          padding: 0px;
+          border-width: 1px 1px 1px 0px;
+          border-style: solid;
+          border-color: black;
+          border-top-right-radius: 6px;
+          border-bottom-right-radius: 6px;
+          background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
+        }
+        QPushButton:pressed {
+          background: #e1e1e1;
+        }
+    '''
+
+    @classmethod
+    def _get_icon(cls) -> QIcon:
+        """ Loads the button icon once and shares it between all instances. """
+        if cls._icon is None:
+            # Render the SVG once into a pixmap, the icon then only scales the pixmap instead of re-rendering the SVG
+            pixmap = QPixmap()
+            pixmap.loadFromData(THREE_DOTS_SVG, "SVG")
+            cls._icon = QIcon(pixmap)
+        return cls._icon
+
     def __init__(self, file_ext_filter: str):
         """ Custom widget consisting of a text box (label) and an interactive button [LABEL][B] """
         super().__init__()
@@ -19,12 +58,6 @@ class TextBoxWithButton(QWidget):
         self.filepath = pathlib.Path("")
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
-        # Required or else the exe does not display the icon
-        if getattr(sys, 'frozen', False):
-            app_path = sys._MEIPASS  # noqa
-        else:
-            app_path = r"C:\Users\foadal\Documents\GitHub\QuadViewAnalyzer"
-
         # Init widgets
         self.label = QLabel("")
         self.button = QPushButton()
@@ -42,21 +75,8 @@ class TextBoxWithButton(QWidget):
             }
         ''')
 
-        self.button.setIcon(QIcon(str(pathlib.Path(app_path) / "assets" / "icons" / "three_dots.svg")))
-        self.button.setStyleSheet('''
-            QPushButton {
-              padding: 0px;
-              border-width: 1px 1px 1px 0px;
-              border-style: solid;
-              border-color: black;
-              border-top-right-radius: 6px;
-              border-bottom-right-radius: 6px;
-              background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 #f6f7fa, stop: 1 #d3d3d3);
-            }
-            QPushButton:pressed {
-              background: #e1e1e1;
-            }
-        ''')
+        self.button.setIcon(self._get_icon())
+        self.button.setStyleSheet(self._BUTTON_QSS)
 
         # Layout
         self.dialog_box_layout = QHBoxLayout()
@@ -75,21 +95,24 @@ class TextBoxWithButton(QWidget):
         self.button.setFixedSize(height, height)
         self.button.setIconSize(QSize(height//2, height//2))
 
-        # Animates the button on press
-        self.button.setStyleSheet(self.button.styleSheet() + "QPushButton:pressed {padding:" + str(height//2) + "px;}")
+        # Animates the button on press, built from the base so repeated calls do not accumulate rules
+        self.button.setStyleSheet(f"{self._BUTTON_QSS}QPushButton:pressed {{padding: {height // 2}px;}}")
 
         # Update the changes
         self.adjustSize()
 
     def open_file_dialog(self):
-        """ Function to open file explorer when button is clicked """
-        filepath, _ = QFileDialog.getOpenFileName(self, caption="Open File", dir="", filter=self.file_ext_filter)
+        """ Function to open file explorer when button is clicked, starts in the last used directory """
+        settings = QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+        last_dir = settings.value(LAST_DIR_KEY, "")
+        filepath, _ = QFileDialog.getOpenFileName(self, caption="Open File", dir=last_dir, filter=self.file_ext_filter)
 
         # If Cancel or X is clicked, don't do anything
         if filepath != "":
             self.filepath = pathlib.Path(filepath)
             filename = self.filepath.name
             self.label.setText(filename)
+            settings.setValue(LAST_DIR_KEY, str(self.filepath.parent))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,7 @@
+"""
+@Author: Foad Alhayek
+@Description: QSettings location shared by the file dialogs of the widgets, e.g., to remember the last used directory.
+"""
+SETTINGS_ORGANIZATION = "QuadViewAnalyzer"
+SETTINGS_APPLICATION = "dialogs"
+LAST_DIR_KEY = "last_dir"
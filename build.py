@@ -0,0 +1,28 @@
+"""
+Builds the main.py into an app, either in development or production mode.
+
+Nuitka is the default backend and builds a standalone directory, which starts considerably faster than a onefile
+executable (and faster than PyInstaller). Ship the directory together with an installer, --onefile is only meant for
+when a single portable file is needed.
+
+Usage: python build.py [--backend {nuitka,pyinstaller}] [--dev] [--onefile]
+"""
+import argparse
+
+import build_nuitka
+import build_pyinstaller
+
+BACKENDS = {
+    "nuitka": build_nuitka.build_project,
+    "pyinstaller": build_pyinstaller.build_project,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Builds the QuadViewAnalyzer app.")
+    parser.add_argument("--backend", choices=BACKENDS.keys(), default="nuitka", help="Build tool to use")
+    parser.add_argument("--dev", action="store_true", help="Build for development instead of production")
+    parser.add_argument("--onefile", action="store_true", help="Pack the app into a single (slower starting) file")
+    args = parser.parse_args()
+
+    BACKENDS[args.backend](dev_mode=args.dev, onefile=args.onefile)
@@ -7,34 +7,64 @@ Usage: build.py
 import sys
 import os
 from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QFont
+from PySide6.QtCore import QTimer
+
+
+def close_splash_screen():
+    # Handles Nuitka splash screen
+    if "NUITKA_ONEFILE_PARENT" in os.environ:
+        import tempfile
+
+        splash_filename = os.path.join(
+            tempfile.gettempdir(),
+            "onefile_%d_splash_feedback.tmp" % int(os.environ["NUITKA_ONEFILE_PARENT"]),
+        )
+
+        if os.path.exists(splash_filename):
+            os.unlink(splash_filename)
+
+    # Handles PyInstaller splash screen
+    if getattr(sys, "frozen", False):
+        import pyi_splash  # noqa
+        pyi_splash.close()
+
+
+def boot():
+    """
+    Imports and builds the MVVM parts as the first event of the event loop, i.e., once the QApplication is set up.
+    This still runs on the GUI thread and blocks it until the window is shown.
+    An exception would otherwise be swallowed by the event loop and leave the app running without a window, therefore
+    the splash screen is closed, the error is reported and the app exits with an error code instead.
+    """
+    global view  # Keep a reference, or else the window is garbage collected
+
+    try:
+        from model.QuadModel import QuadModel
+        from view.QuadView import QuadView
+        from viewmodel.QuadViewModel import QuadViewModel
+
+        model = QuadModel()
+        view_model = QuadViewModel(model)
+        view = QuadView(view_model)
+        view.show()
+    except Exception:  # noqa
+        close_splash_screen()
+        sys.excepthook(*sys.exc_info())
+        app.exit(1)
+        return
+
+    close_splash_screen()
 
-from model.QuadModel import QuadModel
-from view.QuadView import QuadView
-from viewmodel.QuadViewModel import QuadViewModel
 
 app = QApplication(sys.argv)
-app.setStyleSheet("* {font-family: Roboto;"
-                  "font-size: 12px;}")
-model = QuadModel()
-view_model = QuadViewModel(model)
-view = QuadView(view_model)
-view.show()
-
-# Handles Nuitka splash screen
-if "NUITKA_ONEFILE_PARENT" in os.environ:
-    import tempfile
-
-    splash_filename = os.path.join(
-        tempfile.gettempdir(),
-        "onefile_%d_splash_feedback.tmp" % int(os.environ["NUITKA_ONEFILE_PARENT"]),
-    )
-
-    if os.path.exists(splash_filename):
-        os.unlink(splash_filename)
-
-# Handles PyInstaller splash screen
-if getattr(sys, "frozen", False):
-    import pyi_splash  # noqa
-    pyi_splash.close()
+
+# Set the default font on the app instead of a global "*" stylesheet, which every widget would have to resolve
+font = QFont("Roboto")
+font.setPixelSize(12)
+app.setFont(font)
+
+view = None
+QTimer.singleShot(0, boot)
 
 sys.exit(app.exec())
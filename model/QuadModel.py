@@ -6,24 +6,20 @@ The model shall not keep memory of the View state
 
 Usage: main.py, QuadViewModel.py
 """
-import sys
+import re
 import pathlib
 import numpy as np
-import copy
-import inspect
-import importlib.util
 from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 # Internal imports
 from model.helpers.mat_loader import loadmat
 
+# Matches the stripped content of every non-empty, non-comment line in a .conf file ([^\S\n] is any whitespace but \n)
+CONF_ROW_RE = re.compile(r"^[^\S\n]*([^#\s][^\n]*?)[^\S\n]*$", re.MULTILINE)
+
 class QuadModel:
-    def __init__(self):
-        # Get the path to the folder containing the running script (required for exe to work properly)
-        if getattr(sys, 'frozen', False):
-            self.app_path = sys._MEIPASS  # noqa
-        else:
-            self.app_path = pathlib.Path(__file__).parent.parent
+    # Loaded custom data point modules, {filepath: (st_mtime_ns, module)}
+    _module_cache = {}
 
     @staticmethod
     def load_mat(filepath):
@@ -43,29 +39,29 @@ class QuadModel:
         if path.suffix != ".conf":
             return [], []
 
+        # Read the file in one go and let the regex skip empty lines and comments
+        text = path.read_text(encoding="utf-8")
+        rows = CONF_ROW_RE.findall(text)
+
         parsed_data = []
         secondary_data = []
-        with open(path, "r", encoding="utf-8") as fid:
-            for row in fid:
-                row = row.strip()
-
-                # Skip empty lines and comments
-                if not row or row.startswith('#'):
-                    continue
-
-                # Split based on sep and handle edge case of removing empty strings (caused by excess of sep)
-                if secondary_sep in row:
-                    items = [item.strip() for item in row.split(secondary_sep) if item.strip()]
-                    secondary_data.append(items)
-                else:
-                    items = [item.strip() for item in row.split(sep) if item.strip()]
-                    parsed_data.append(items)
+        for row in rows:
+            # Split based on sep and handle edge case of removing empty strings (caused by excess of sep)
+            if secondary_sep in row:
+                items = [item for item in (token.strip() for token in row.split(secondary_sep)) if item]
+                secondary_data.append(items)
+            else:
+                items = [item for item in (token.strip() for token in row.split(sep)) if item]
+                parsed_data.append(items)
 
         return parsed_data, secondary_data
 
     @staticmethod
-    def invalid_signal(path) -> bool:
-        """ Function can be expanded in the future """
+    def invalid_signal(path: list[str]) -> bool:
+        """
+        Checks if the item path (list of keys, e.g., ["parent", "child"]) can not point to a signal, i.e., it needs at
+        least a parent and a child key. Function can be expanded in the future.
+        """
         return len(path) < 2
 
     @staticmethod
@@ -77,6 +73,10 @@ class QuadModel:
         if data == {}:
             return model
 
+        # Nothing is connected to the new model yet, so skip emitting a rowsInserted signal for every appended row.
+        # The proxy model resets itself once the complete model is set as its source.
+        model.blockSignals(True)
+
         root_item = model.invisibleRootItem()
         stack = [(root_item, data)]
 
@@ -84,12 +84,17 @@ class QuadModel:
             parent, current_data = stack.pop()
 
             if isinstance(current_data, dict):
-                for key, value in current_data.items():
-                    key_item = QStandardItem(str(key))
-                    parent.appendRow(key_item)
+                # Sort once here (case-insensitive like the mat loader) instead of letting Qt sort the rows afterwards
+                keys = sorted(current_data, key=lambda k: str(k).lower())
+
+                # Append all children of a parent in one call instead of one Qt call (and row insertion) per key
+                children = [QStandardItem(key if type(key) is str else str(key)) for key in keys]
+                parent.appendRows(children)
+
+                stack.extend([(key_item, current_data[key]) for key_item, key in zip(children, keys)
+                              if isinstance(current_data[key], dict)])
 
-                    if isinstance(value, dict):
-                        stack.append((key_item, value))
+        model.blockSignals(False)
         return model
 
     @staticmethod
@@ -97,82 +102,178 @@ class QuadModel:
         """ Converts a nested QStandardItem into a list that represents the path to it. """
         item_path = []
         while item is not None:
-            item_path.insert(0, item.text())
+            item_path.append(item.text())
             item = item.parent()
+        item_path.reverse()
         return item_path
 
-    @staticmethod
-    def isinstance_sequence(arr):
-        """ Helper function to determine if the variable is a sequence/list. """
-        return isinstance(arr, (list, tuple, np.ndarray))
-
     def min_dict_value(self, data: dict, keys: list[str]) -> float | None:
         """
         Finds the minimum value from a nested dictionary for any of the specified keys.
-        The values must be either a single numeric value or a 1D array-like sequence.
+        The values must be either a single numeric value or a 1D array-like sequence, where only the first element is
+        considered.
         This function does not support multidimensional arrays.
 
         :param data: A (nested) dictionary containing 1D array data.
         :param keys: A list of keys to search for.
         :return: The smallest numeric value found, or None if no valid candidate is found.
         """
-        min_val: float | None = None
         keys = set(keys)
-        is_seq = self.isinstance_sequence # Cache locally, optimization
+        # Dispatch on the exact types, the loaded data only holds plain dicts, lists, tuples and ndarrays (no subclass)
+        ndarray = np.ndarray  # Cache locally, optimization
+        seq_types = frozenset((list, tuple, ndarray))
+        number_types = (int, float, np.integer, np.floating)
+        scalar_candidates = []
         stack = [data]
+        seen = {id(data)}  # Sub-dicts can be shared between parents, only visit them once
 
         while stack:
             current = stack.pop()
 
-            if isinstance(current, dict):
+            if type(current) is dict:
                 for key, val in current.items():
+                    val_type = type(val)
+
                     if key in keys:
-                        if is_seq(val) and len(val) > 0:
+                        # Only the first sample is the reference, e.g., the start of a timestamp signal
+                        if val_type in seq_types and len(val) > 0:
                             candidate = val[0]
                         else:
                             candidate = val
-                        try:
-                            candidate = float(candidate)
-                        except (TypeError, ValueError):
+                        # Numbers are converted directly, only other values (e.g., strings) may fail to convert
+                        if isinstance(candidate, number_types):
+                            scalar_candidates.append(float(candidate))
+                        else:
+                            try:
+                                scalar_candidates.append(float(candidate))
+                            except (TypeError, ValueError):
+                                continue
+
+                    # Add nested (not yet visited) dictionaries to the stack
+                    if val_type is dict:
+                        if id(val) not in seen:
+                            seen.add(id(val))
+                            stack.append(val)
+                    elif val_type in seq_types:
+                        # Extend the stack with any dicts found in the list (only object arrays can hold dicts)
+                        if val_type is ndarray and val.dtype.kind != "O":
                             continue
-                        if min_val is None or candidate < min_val:
-                            min_val = candidate
+                        for item in val:
+                            if type(item) is dict and id(item) not in seen:
+                                seen.add(id(item))
+                                stack.append(item)
+            elif type(current) in seq_types:
+                stack.extend([item for item in current if type(item) is dict])
+
+        return min(scalar_candidates) if scalar_candidates else None
+
+    @staticmethod
+    def read_only_snapshot(data: dict) -> dict:
+        """
+        Copies the structure of a nested dictionary, so the original data can not be modified through the snapshot.
+        Numeric arrays are replaced by read-only views of the originals (their data is never copied), lists and object
+        arrays (e.g., MATLAB cell/struct arrays) are copied and their elements snapshotted in turn, and any other
+        mutable objects (e.g., MATLAB structs) are deep copied. Writing to an array of the snapshot raises a ValueError.
 
-                    # Add nested dictionaries to the stack
-                    if isinstance(val, dict):
-                        stack.append(val)
-                    elif is_seq(val):
-                        # Extend the stack with any dicts found in the list
-                        stack.extend([item for item in val if isinstance(item, dict)])
-            elif is_seq(current):
-                stack.extend([item for item in current if isinstance(item, dict)])
+        :param data: A (nested) dictionary.
+        :return: The snapshot of the dict.
+        """
+        import copy
 
-        return min_val
+        ndarray = np.ndarray  # Cache locally, optimization
+        immutable_types = (str, bytes, int, float, complex, bool, type(None), np.generic)
+        snapshot = {}
+        object_arrays = []    # Locked once all their elements are snapshotted
+        stack = [(snapshot, key, val) for key, val in data.items()]
+
+        while stack:
+            target, key, val = stack.pop()
+
+            # Dispatch on the exact type first, the loaded data mostly holds plain dicts, lists and ndarrays
+            val_type = type(val)
+
+            if val_type is dict:
+                nested_snapshot = {}
+                target[key] = nested_snapshot
+                stack.extend([(nested_snapshot, nested_key, nested_val) for nested_key, nested_val in val.items()])
+            elif val_type is ndarray or isinstance(val, ndarray):
+                if val.dtype.kind == "O":
+                    # The elements are references to (mutable) objects, copy the array and snapshot every element
+                    array_copy = val.copy()
+                    flat_copy = array_copy.reshape(-1)  # A view, the copy is contiguous
+                    target[key] = array_copy
+                    object_arrays.append(array_copy)
+                    stack.extend([(flat_copy, idx, elem) for idx, elem in enumerate(flat_copy)])
+                else:
+                    view = val.view()
+                    view.flags.writeable = False
+                    target[key] = view
+            elif val_type is list:
+                # Snapshot the elements as well, a shallow copy would share nested dicts and arrays
+                list_copy = val.copy()
+                target[key] = list_copy
+                stack.extend([(list_copy, idx, elem) for idx, elem in enumerate(val)])
+            elif isinstance(val, immutable_types):
+                target[key] = val
+            else:
+                target[key] = copy.deepcopy(val)
+
+        for array in object_arrays:
+            array.flags.writeable = False
+
+        return snapshot
 
     @staticmethod
     def import_custom_data_points(filepath: pathlib.Path, data: dict) -> dict:
         """
         Loads a Python module and searches for functions that takes one argument (the data) and returns a tuple (x, y).
         If found, its results are stored in a dictionary with the parent key as func name and children "x" and "y".
+        The functions get a read-only snapshot of the data, a function that modifies its input arrays in place is rerun
+        on a deep copy instead. Either way, the original data is never modified.
 
         :param filepath: Path to the Python file containing the custom functions.
         :param data: The preloaded data dictionary.
         :return: Dict {<func_name>: {x:, y:}}
         """
-        # Load the module from the given file path, the name is arbitrary given
-        spec = importlib.util.spec_from_file_location("unique_name_foad_f38aa4b22c", filepath)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Only needed when importing custom data points, keep them out of the startup path
+        import copy
+        import inspect
+        import importlib.util
+
+        # Reuse the module if the file has not been modified since it was last loaded
+        cache_key = str(filepath)
+        mtime_ns = filepath.stat().st_mtime_ns
+        cached = QuadModel._module_cache.get(cache_key)
+
+        if cached is not None and cached[0] == mtime_ns:
+            module = cached[1]
+        else:
+            # Load the module from the given file path, the name is arbitrary given
+            spec = importlib.util.spec_from_file_location("unique_name_foad_f38aa4b22c", filepath)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            QuadModel._module_cache[cache_key] = (mtime_ns, module)
 
         # Find potential candidate functions
         candidates = []
         for func_name in dir(module):
             if not func_name.startswith("__"):                      # Does not start with __
                 func_handle = getattr(module, func_name)
-                if callable(func_handle):                           # Is callable (to prevent imports like numpy)
-                    params = inspect.signature(func_handle)
-                    if len(params.parameters) == 1:                 # Has only one parameter, e.g., foo(x)
-                        candidates.append((func_name, func_handle))
+                if not callable(func_handle):                       # Is callable (to prevent imports like numpy)
+                    continue
+                if getattr(func_handle, "__module__", None) != module.__name__:
+                    continue                                        # Is defined in the file (not imported)
+
+                # Has only one parameter, e.g., foo(x). Read the code object, inspect is only needed for e.g. classes
+                code = getattr(func_handle, "__code__", None)
+                if code is not None:
+                    n_params = (code.co_argcount + code.co_kwonlyargcount + bool(code.co_flags & inspect.CO_VARARGS)
+                                + bool(code.co_flags & inspect.CO_VARKEYWORDS))
+                else:
+                    n_params = len(inspect.signature(func_handle).parameters)
+
+                if n_params == 1:
+                    candidates.append((func_name, func_handle))
 
         if not candidates:
             return {}
@@ -183,9 +284,15 @@ class QuadModel:
             func_name, func = candidate
 
             try:
-                # Deepcopy because we can't trust that the functions do not accidentally modify the original data
-                temp_data = copy.deepcopy(data)
-                result = func(temp_data)
+                try:
+                    # Read-only snapshot because we can't trust that the functions do not accidentally modify the
+                    # original data, no array data is copied
+                    result = func(QuadModel.read_only_snapshot(data))
+                except ValueError as e:
+                    # The function writes to its input arrays, rerun it on a (slow) deep copy to keep it working
+                    if "read-only" not in str(e):
+                        raise
+                    result = func(copy.deepcopy(data))
             except Exception as e:
                 print(f"\033[91mCould not parse {func_name} in file {filepath} due to {type(e).__name__}: {e}\033[0m")
                 continue
@@ -222,13 +329,15 @@ class QuadModel:
         if not data:
             return ""
 
-        # Determine the maximum width for keys, values, and units, +1 for adding the colon back
-        max_key_length = max(len(key) for key in data.keys()) + 1
-        max_value_length = max(len(f"{value:.2f}") for value in data.values())
+        # Format the values once, then use them both for measuring and for the output
+        pairs = [(key + ":", f"{value:.2f}") for key, value in data.items()]
+
+        # Determine the maximum width for keys (including the colon) and values
+        max_key_length = max(len(key) for key, _ in pairs)
+        max_value_length = max(len(value) for _, value in pairs)
 
         # Reformat the string
-        formatted_lines = [f"{key + ':':<{max_key_length}} {value:>{max_value_length}.2f}" for
-                           key, value in data.items()]
+        formatted_lines = [f"{key:<{max_key_length}} {value:>{max_value_length}}" for key, value in pairs]
 
         return "\n".join(formatted_lines)
 
@@ -242,6 +351,12 @@ class QuadModel:
         :param override_dict: The dictionary whose values override or merge into base_dict
         :return: The merged dict
         """
+        # Nothing to merge, the result is a plain copy of the other dict
+        if not override_dict:
+            return base_dict.copy()
+        if not base_dict:
+            return override_dict.copy()
+
         merged_result = base_dict.copy()
         stack = [(merged_result, override_dict)]
 
@@ -249,7 +364,7 @@ class QuadModel:
             current_base, current_source = stack.pop()
 
             for key, source_val in current_source.items():
-                if key in current_base and isinstance(current_base[key], dict) and isinstance(current_source, dict):
+                if key in current_base and isinstance(current_base[key], dict) and isinstance(source_val, dict):
                     nested_base_copy = current_base[key].copy()
                     current_base[key] = nested_base_copy
                     stack.append((nested_base_copy, source_val))
@@ -3,7 +3,10 @@
 @Description: Function to convert .mat to python (nested) dictionaries.
 """
 import re
-import scipy.io as sio
+
+# Matches the version number in the (bytes) header of a mat file, e.g., b"MATLAB 5.0 MAT-file ..."
+MAT_VERSION_RE = re.compile(rb"(\d+\.\d+)")
+
 
 def loadmat(filepath):
     """
@@ -13,14 +16,17 @@ def loadmat(filepath):
     :param filepath: Path to the mat file.
     :return: Content in dict form.
     """
+    # SciPy is heavy to import, only import it once a mat file is actually loaded (cached in sys.modules afterwards)
+    import scipy.io as sio
+
     data = sio.loadmat(filepath, struct_as_record=False, squeeze_me=True)
 
-    if "__header__" in data:
-        decoded_string = data["__header__"].decode('utf-8')
-        match = re.search(r'\d+\.\d+', decoded_string)
+    header = data.get("__header__")
+    if header is not None:
+        match = MAT_VERSION_RE.search(header)
 
         if match is not None:
-            if float(match.group()) >= 7.3:
+            if float(match.group(1)) >= 7.3:
                 print(
                     f"Warning, you are using a different mat file version (7.3 or above) which has not been tested.\n"
                     f"The function might not work and the results are not guaranteed.")
@@ -30,33 +36,34 @@ def loadmat(filepath):
     data.pop("__version__", None)
     data.pop("__globals__", None)
 
-    return _check_keys(data)
+    return _check_keys(data, sio.matlab.mat_struct)
 
 
-def _check_keys(data):
+def _check_keys(data, mat_struct):
     """
-    Sorts and checks if the keys are structs. If yes
+    Checks if the keys are structs. If yes
     todict is called to convert to nested dictionaries.
     """
-    for key in sorted(data.keys(), key=lambda s: s.lower()):
-        if isinstance(data[key], sio.matlab.mat_struct):
-            data[key] = _todict_iterative(data[key])
+    # The order does not matter as the values are replaced by key (the tree menu sorts the keys itself)
+    for key, val in data.items():
+        if isinstance(val, mat_struct):
+            data[key] = _todict_iterative(val, mat_struct)
     return data
 
 
-def _todict_iterative(matobj):
+def _todict_iterative(matobj, mat_struct):
     """ Iteratively converts MATLAB structs to nested dictionaries. """
     result = {}
     stack = [(result, matobj)]
 
     while stack:
         current_dict, current_obj = stack.pop()
-        fieldnames = sorted(current_obj._fieldnames, key=lambda s: s.lower())
 
-        for fieldname in fieldnames:
+        # No need to sort, the tree menu sorts the keys when it is generated
+        for fieldname in current_obj._fieldnames:
             elem = getattr(current_obj, fieldname)
 
-            if isinstance(elem, sio.matlab.mat_struct):
+            if isinstance(elem, mat_struct):
                 new_dict = {}
                 current_dict[fieldname] = new_dict
                 stack.append((new_dict, elem))
@@ -0,0 +1,34 @@
+"""
+Tests for the Model logic.
+
+Usage: python -m pytest
+"""
+import textwrap
+import numpy as np
+
+# Internal imports
+from model.QuadModel import QuadModel
+
+
+def test_import_custom_data_points_mutating_and_non_mutating(tmp_path):
+    filepath = tmp_path / "custom_points.py"
+    filepath.write_text(textwrap.dedent("""
+        def non_mutating(data):
+            return data["ts"][:2], data["signals"]["speed"][:2]
+
+        def mutating(data):
+            speed = data["signals"]["speed"]
+            speed *= 2
+            return data["ts"], speed
+    """))
+    data = {"ts": np.array([0.0, 1.0, 2.0]), "signals": {"speed": np.array([1.0, 2.0, 3.0])}}
+
+    custom_items = QuadModel.import_custom_data_points(filepath, data)
+
+    assert set(custom_items) == {"non_mutating", "mutating"}
+    np.testing.assert_array_equal(custom_items["non_mutating"]["x"], [0.0, 1.0])
+    np.testing.assert_array_equal(custom_items["non_mutating"]["y"], [1.0, 2.0])
+    np.testing.assert_array_equal(custom_items["mutating"]["y"], [2.0, 4.0, 6.0])
+    # The original data is untouched by both functions
+    np.testing.assert_array_equal(data["signals"]["speed"], [1.0, 2.0, 3.0])
+    assert data["signals"]["speed"].flags.writeable
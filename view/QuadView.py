@@ -6,21 +6,63 @@ The View connects signals from the ViewModel and a function with equal amounts o
 
 Usage: main.py, QuadViewModel.py
 """
-import sys
+import os
 import pathlib
+import contextlib
 import numpy as np
 import pyqtgraph as pg
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QAbstractItemView, QMainWindow, QTextEdit,
-                               QLineEdit)
-from PySide6.QtGui import QIcon, QDragEnterEvent, QColor, QStandardItemModel, QStandardItem, QFont
-from PySide6.QtCore import Qt, QSortFilterProxyModel, QAbstractItemModel, QModelIndex
+                               QLineEdit, QGraphicsItem)
+from PySide6.QtGui import QIcon, QDragEnterEvent, QColor, QBrush, QStandardItemModel, QStandardItem, QFont
+from PySide6.QtCore import Qt, QSortFilterProxyModel, QModelIndex, QTimer
 
 # Internal imports
 import assets.widgets as c_widgets
 from assets.palettes.Palette import LightTheme, DarkTheme  # noqa
 from assets.palettes.Colormap import Colormap
+from assets.paths import APP_PATH
+from viewmodel.QuadViewModel import SKIP_KEYS
+
+# The themes only hold (class level) color strings, so one shared instance is enough for all windows
+LIGHT_THEME = LightTheme()
+
+# Draw the plots with OpenGL if PyOpenGL is installed (optional), which skips pyqtgraph's software rendering of the
+# curves through QPainterPaths. Must be set before any of the plot widgets are created.
+try:
+    import OpenGL  # noqa
+except ImportError:
+    pass
+else:
+    pg.setConfigOptions(useOpenGL=True, enableExperimental=True, antialias=False)
 
 class QuadView(QMainWindow):
+    # Stylesheet templates for the widgets, formatted with the widget selector, font size and theme colors
+    _WIDGET_QSS = '''
+        {selector} {{
+          font-size: {font_size};
+          background-color: {background};
+          color: {text};
+        }}
+    '''
+    _TS_BAR_QSS = _WIDGET_QSS + '''
+        QLineEdit:hover {{
+          background-color: #e8e8e8;
+        }}
+        QLineEdit:focus {{
+          background-color: #ffffff;
+        }}
+    '''
+
+    # Shared between all windows, see _get_window_icon()
+    _window_icon: QIcon | None = None
+
+    @classmethod
+    def _get_window_icon(cls) -> QIcon:
+        """ Loads the window icon once and shares it between all instances. """
+        if cls._window_icon is None:
+            cls._window_icon = QIcon(str(APP_PATH / "assets" / "icons" / "gui_logo.ico"))
+        return cls._window_icon
+
     def __init__(self, view_model):
         super().__init__()
 
@@ -43,15 +85,14 @@ class QuadView(QMainWindow):
         di_font_size = 10
         self.slider_scaling_factor = 100
         self.cm = Colormap("fof20")
-
-        # Get the path to the folder containing the running script (required for exe to work properly)
-        if getattr(sys, 'frozen', False):
-            app_path = sys._MEIPASS  # noqa
-        else:
-            app_path = pathlib.Path(__file__).parent.parent
+        self.highlighted_items = set()  # Tree menu items that are currently highlighted
+        self._plot_batch_depth = 0      # Nesting depth of batched_plot_updates()
+        self._selected_signals_text = ""  # Text currently shown in the selected signals display
+        self.proxy_model: QSortFilterProxyModel | None = None  # Tree menu models, set when a data file is loaded
+        self.tree_model: QStandardItemModel | None = None
 
         # Handy predefined paths
-        icons_path = pathlib.Path(app_path) / "assets" / "icons"
+        icons_path = APP_PATH / "assets" / "icons"
 
         ###############
         # Init the UI #
@@ -63,9 +104,20 @@ class QuadView(QMainWindow):
         main_layout = QVBoxLayout()
         central_widget.setLayout(main_layout)
 
-        self.theme = LightTheme()
+        self.theme = LIGHT_THEME
+
+        # Theme brushes used to (un)highlight tree menu items, created once and shared by all items instead of
+        # converting a color into a new brush on every setBackground/setForeground call
+        self.background_brush = QBrush(QColor(self.theme.background))
+        self.text_brush = QBrush(QColor(self.theme.text))
+        self.highlight_brush = QBrush(QColor(self.theme.highlight))
+        self.highlight_text_brush = QBrush(QColor(self.theme.highlight_text))
+        self.accent_brush = QBrush(QColor(self.theme.accent))
+        self.accent_text_brush = QBrush(QColor(self.theme.accent_text))
+
         self.setWindowTitle("QuadViewAnalyzer")
-        self.setWindowIcon(QIcon(str(icons_path / "gui_logo.ico")))
+        # Decode the icon after the window is shown (next event loop pass), so it does not delay the first paint
+        QTimer.singleShot(0, self, lambda: self.setWindowIcon(self._get_window_icon()))
         self.resize(window_width, window_height)
         self.setStyleSheet(f"background-color: {self.theme.background};")
         self.acceptDrops()
@@ -75,6 +127,7 @@ class QuadView(QMainWindow):
         #########################################
         # Init subplots
         glw: pg.GraphicsLayout | pg.GraphicsLayoutWidget = pg.GraphicsLayoutWidget()
+        self.glw = glw
 
         ###################
         #    TOP LEFT     #
@@ -89,6 +142,11 @@ class QuadView(QMainWindow):
         #  Analysis Graph #
         ###################
         self.graph_ax = glw.addPlot(row=0, col=1, title="Graph analysis")
+
+        # Only draw the visible part of the (time ascending) plots, downsampled to the pixel width of the view. Set on
+        # the plot item so every added plot inherits it (and it stays in sync with the plot's right click options)
+        self.graph_ax.setClipToView(True)
+        self.graph_ax.setDownsampling(auto=True, mode="peak")
         self.graph_plots = {}
         self.vline = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen("r", width=1))
         self.graph_ax.addItem(self.vline)
@@ -142,6 +200,12 @@ class QuadView(QMainWindow):
         self.slider.setValue(0)
         self.slider.valueChanged.connect(self.on_slider_change)
 
+        # Limits the data insight updates while dragging the slider to ~30 Hz (see on_slider_change)
+        self.slider_timer = QTimer(self)
+        self.slider_timer.setSingleShot(True)
+        self.slider_timer.setInterval(33)
+        self.slider_timer.timeout.connect(self.update_slider_data_insight)
+
         ######################
         # TREE MENU SETTINGS #
         ######################
@@ -149,6 +213,13 @@ class QuadView(QMainWindow):
         self.tree_view.setMinimumWidth(200)
         self.tree_view.setHeaderHidden(False)
 
+        # All rows are single line text, let the view use the first row's height instead of measuring every row
+        self.tree_view.setUniformRowHeights(True)
+
+        # Scroll by pixels, the view then scrolls the already painted rows and only paints the uncovered strip
+        self.tree_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.tree_view.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+
         # Turn off so we can manually control double-clicking and highlighting
         self.tree_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.tree_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
@@ -184,6 +255,10 @@ class QuadView(QMainWindow):
         self.textbox_selected_signals = QTextEdit()
         self.textbox_selected_signals.setReadOnly(True)
 
+        # Only plain text is set programmatically, no need for rich text handling or an undo history of every update
+        self.textbox_selected_signals.setAcceptRichText(False)
+        self.textbox_selected_signals.setUndoRedoEnabled(False)
+
         ##############################
         # Connect with the ViewModel #
         ##############################
@@ -206,43 +281,11 @@ class QuadView(QMainWindow):
         button_normalize_plots.set_size(40, 40)
         button_add_predefined_signals.set_size(40, 40)
 
-        self.global_ts_ref_bar.setStyleSheet('''
-            FloatInputWidget QLineEdit {
-              font-size: ''' + tree_font_size + ''';
-              background-color: ''' + self.theme.background + ''';
-              color: ''' + self.theme.text + ''';
-            }
-            QLineEdit:hover {
-              background-color: #e8e8e8;
-            }
-            QLineEdit:focus {
-              background-color: #ffffff;
-            }
-        ''')
-
-        search_bar.setStyleSheet('''
-            QLineEdit {
-              font-size: ''' + tree_font_size + ''';
-              background-color: ''' + self.theme.background + ''';
-              color: ''' + self.theme.text + ''';
-            }
-        ''')
-
-        self.tree_view.setStyleSheet('''
-            QTreeView {
-              font-size: ''' + tree_font_size + ''';
-              background-color: ''' + self.theme.background + ''';
-              color: ''' + self.theme.text + ''';
-            }
-        ''')
-
-        self.textbox_selected_signals.setStyleSheet('''
-            QTextEdit {
-              font-size: ''' + tree_font_size + ''';
-              background-color: ''' + self.theme.background + ''';
-              color: ''' + self.theme.text + ''';
-            }
-        ''')
+        qss_args = dict(font_size=tree_font_size, background=self.theme.background, text=self.theme.text)
+        self.global_ts_ref_bar.setStyleSheet(self._TS_BAR_QSS.format(selector="FloatInputWidget QLineEdit", **qss_args))
+        search_bar.setStyleSheet(self._WIDGET_QSS.format(selector="QLineEdit", **qss_args))
+        self.tree_view.setStyleSheet(self._WIDGET_QSS.format(selector="QTreeView", **qss_args))
+        self.textbox_selected_signals.setStyleSheet(self._WIDGET_QSS.format(selector="QTextEdit", **qss_args))
 
         #######################################
         # Create the layouts - Order matters! #
@@ -304,38 +347,66 @@ class QuadView(QMainWindow):
         """ Updates the filter of the proxy model based on the search text. """
         self._view_model.set_filter_text(search_query)
 
+    @contextlib.contextmanager
+    def batched_plot_updates(self):
+        """
+        Context manager that suspends the auto-ranging and repainting of the graph while many plots are added, updated
+        or removed, so the graph is only redrawn once when the outermost batch exits instead of once per plot.
+        The batches can be nested, e.g., a batched call within another batched call.
+        """
+        view_box = self.graph_ax.getViewBox()
+        outermost = self._plot_batch_depth == 0
+
+        if outermost:
+            auto_range = view_box.autoRangeEnabled()
+            view_box.disableAutoRange()
+            self.glw.setUpdatesEnabled(False)
+
+        self._plot_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._plot_batch_depth -= 1
+
+            if outermost:
+                # Restore the auto-range, unless it was already re-enabled within the batch (e.g., autoBtnClicked)
+                if not any(view_box.autoRangeEnabled()):
+                    view_box.enableAutoRange(x=auto_range[0], y=auto_range[1])
+                self.glw.setUpdatesEnabled(True)
+
     def update_all_plots(self) -> None:
         """ Re-plots all plots that are in memory. Used when ref ts is changed. """
-        skip_keys = ("ts", "ts_raw")
-        for parent, entries in self._view_model.selected_signals_data.items():
-            # Read one instance and check if it is a nested dict (if nested == custom item)
-            custom_dict = isinstance(next(iter(entries.values()), None), dict)
-            if custom_dict:
-                for child, custom_entries in entries.items():
-                    ts = custom_entries["ts"]
-                    for key, val in custom_entries.items():
-                        if key in skip_keys:
+        with self.batched_plot_updates():
+            for parent, entries in self._view_model.selected_signals_data.items():
+                # Read one instance and check if it is a nested dict (if nested == custom item)
+                custom_dict = isinstance(next(iter(entries.values()), None), dict)
+                if custom_dict:
+                    for child, custom_entries in entries.items():
+                        ts = custom_entries["ts"]
+                        for key, val in custom_entries.items():
+                            if key in SKIP_KEYS:
+                                continue
+                            signal_name = f"{parent}/{child}"
+                            self.update_graph(ts, val, signal_name)
+                elif "ts" in entries:
+                    ts = entries["ts"]
+
+                    for child, item in entries.items():
+                        if child in SKIP_KEYS:
                             continue
                         signal_name = f"{parent}/{child}"
-                        self.update_graph(ts, val, signal_name)
-            elif "ts" in entries:
-                ts = entries["ts"]
-
-                for child, item in entries.items():
-                    if child in skip_keys:
-                        continue
-                    signal_name = f"{parent}/{child}"
-                    self.update_graph(ts, item, signal_name)
+                        self.update_graph(ts, item, signal_name)
 
         self.update_qva_on_item_change()
 
-    def update_graph(self, x: list, y: list, signal_name: str) -> None:
+    def update_graph(self, x: np.ndarray, y: np.ndarray, signal_name: str) -> None:
         """
         Updates the graph by updating an existing plot or adding a new plot to the graph view.
         See get_signal_data() in view to see how the signal_name is named -> "parent/child".
+        The data is passed on to pyqtgraph as is (no copies), so pass NumPy arrays and not lists.
 
-        :param x: List of x-axis data points.
-        :param y: List of y-axis data points.
+        :param x: Array of x-axis data points.
+        :param y: Array of y-axis data points.
         :param signal_name: Name of the signal to plot. Here it follows the "parent/child" naming convention.
         """
         if signal_name in self.graph_plots:
@@ -355,7 +426,14 @@ class QuadView(QMainWindow):
                 self.graph_ax.addItem(vline)
                 self.graph_plots[signal_name] = (vline, dummy_plot)
             else:
-                self.graph_plots[signal_name] = self.graph_ax.plot(x, y, pen=pen, name=signal_name)
+                plot = self.graph_ax.plot(x, y, pen=pen, name=signal_name)
+
+                # Without OpenGL, cache the rendered curve so e.g. moving the vertical line over it (slider) only blits
+                # the cache instead of redrawing the curve path. With OpenGL the curves are already drawn on the GPU.
+                if not pg.getConfigOption("useOpenGL"):
+                    plot.curve.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+                self.graph_plots[signal_name] = plot
 
     def on_slider_change(self, slider_value: int):
         time = slider_value / self.slider_scaling_factor
@@ -363,7 +441,14 @@ class QuadView(QMainWindow):
         # Update the vertical line
         self.vline.setPos(time)
 
-        # Update data insight text
+        # Update data insight text, at most once per timer interval as it searches through every selected signal. The
+        # timer is not restarted while running, so the text keeps updating during a drag and ends on the latest value.
+        if not self.slider_timer.isActive():
+            self.slider_timer.start()
+
+    def update_slider_data_insight(self):
+        """ Updates the data insight text to the current slider value. """
+        time = self.slider.value() / self.slider_scaling_factor
         self.set_time_based_data_insight(time)
 
     def set_slider_range(self):
@@ -377,8 +462,8 @@ class QuadView(QMainWindow):
 
         di_min, di_max = self._view_model.get_time_range_in_data_insight()
 
-        # Compute min
-        x_vals = [item.getData()[0][0] for item in self.graph_plots.values() if not isinstance(item, tuple)]
+        # Compute min (from the original data, getData() only returns the clipped and downsampled data in view)
+        x_vals = [item.getOriginalDataset()[0][0] for item in self.graph_plots.values() if not isinstance(item, tuple)]
         if not x_vals and di_min == float("inf"):
             return     # if only vertical lines and no DI
 
@@ -386,7 +471,7 @@ class QuadView(QMainWindow):
         current_min = int(min(x_vals))
 
         # Compute max
-        x_vals = [item.getData()[0][-1] for item in self.graph_plots.values() if not isinstance(item, tuple)]
+        x_vals = [item.getOriginalDataset()[0][-1] for item in self.graph_plots.values() if not isinstance(item, tuple)]
         x_vals.append(di_max)
         current_max = int(np.ceil(max(x_vals)))
 
@@ -413,16 +498,25 @@ class QuadView(QMainWindow):
         """ Updates the text area to show which signals have been selected. """
         selected = self._view_model.selected_signals_data
         display_lines = [
-            f"• {parent}: {', '.join(key for key in signals if key != 'ts' and key !='ts_raw')}"
+            f"• {parent}: {', '.join([key for key in signals if key not in SKIP_KEYS])}"
             for parent, signals in selected.items()
         ]
-        self.textbox_selected_signals.setPlainText("\n".join(display_lines))
+        self.set_selected_signals_text("\n".join(display_lines))
+
+    def set_selected_signals_text(self, text: str):
+        """
+        Sets the text of the selected signals display. The display is often refreshed without the selection changing
+        (e.g., a new reference timestamp), skip those to avoid a full re-layout of the text box.
+        """
+        if text == self._selected_signals_text:
+            return
+
+        self._selected_signals_text = text
+        self.textbox_selected_signals.setPlainText(text)
 
     def index_to_item(self, index: QModelIndex) -> QStandardItem:
-        proxy_model: QSortFilterProxyModel | QAbstractItemModel = self.tree_view.model()
-        source_index = proxy_model.mapToSource(index)
-        tree_model: QStandardItemModel | QAbstractItemModel = proxy_model.sourceModel()
-        return tree_model.itemFromIndex(source_index)
+        source_index = self.proxy_model.mapToSource(index)
+        return self.tree_model.itemFromIndex(source_index)
 
     def on_tree_item_right_double_clicked(self, index: QModelIndex):
         """ Handles tree menu right-clicking features. """
@@ -446,8 +540,9 @@ class QuadView(QMainWindow):
                 self.set_time_based_data_insight(time)
 
                 # Remove highlight of item in the tree menu
-                item.setBackground(QColor(self.theme.background))
-                item.setForeground(QColor(self.theme.text))
+                item.setBackground(self.background_brush)
+                item.setForeground(self.text_brush)
+                self.highlighted_items.discard(item)
         else:
             item_added = self._view_model.select_item(item_path, backend_memory=self._view_model.selected_di_only_data)
 
@@ -464,34 +559,40 @@ class QuadView(QMainWindow):
 
         # Build dict path to be sent to ViewModel
         item_path = self._view_model.tree_item_to_path(item)
-        if self._view_model.is_signal_already_selected(item_path):
-            item_deleted, signal_name = self._view_model.deselect_item(item_path)
 
-            if item_deleted:
-                # Remove highlight of item in the tree menu
-                item.setBackground(QColor(self.theme.background))
-                item.setForeground(QColor(self.theme.text))
-
-                # Remove the deselected signal plot/vertical line
-                if isinstance(self.graph_plots[signal_name], tuple):
-                    vline, dummy_plot = self.graph_plots[signal_name]
-                    self.graph_ax.removeItem(vline)
-                    self.graph_ax.removeItem(dummy_plot)
-                else:
-                    self.graph_ax.removeItem(self.graph_plots[signal_name])
-                del self.graph_plots[signal_name]
-
-                # Update colormap, display, and slider
-                self.cm.release_color(signal_name)
-                self.update_qva_on_item_change()
-        else:
-            item_added = self._view_model.select_item(item_path)
+        # Adding/removing a plot and the auto-range afterwards (update_qva_on_item_change) only redraws the graph once
+        with self.batched_plot_updates():
+            if self._view_model.is_signal_already_selected(item_path):
+                item_deleted, signal_name = self._view_model.deselect_item(item_path)
+
+                if item_deleted:
+                    # Remove highlight of item in the tree menu
+                    item.setBackground(self.background_brush)
+                    item.setForeground(self.text_brush)
+                    self.highlighted_items.discard(item)
+
+                    # Remove the deselected signal plot/vertical line
+                    if isinstance(self.graph_plots[signal_name], tuple):
+                        vline, dummy_plot = self.graph_plots[signal_name]
+                        self.graph_ax.removeItem(vline)
+                        self.graph_ax.removeItem(dummy_plot)
+                    else:
+                        self.graph_ax.removeItem(self.graph_plots[signal_name])
+                    del self.graph_plots[signal_name]
+
+                    # Update colormap, display, and slider
+                    self.cm.release_color(signal_name)
+                    self.update_qva_on_item_change()
+            else:
+                item_added = self._view_model.select_item(item_path)
 
-            if item_added:
-                self.add_signal(item, item_path, update_qva=True)
+                if item_added:
+                    self.add_signal(item, item_path, update_qva=True)
 
     def parse_and_load_conf(self, path: pathlib.Path):
-        self._view_model.parse_and_load_conf(path)
+        # A configuration file can add many plots at once
+        with self.batched_plot_updates():
+            self._view_model.parse_and_load_conf(path)
 
     def update_qva_on_item_change(self):
         """ Function to update and refresh the QVA application. """
@@ -508,8 +609,9 @@ class QuadView(QMainWindow):
         :return:
         """
         # Highlight item in the tree menu
-        item.setBackground(QColor(self.theme.accent))
-        item.setForeground(QColor(self.theme.accent_text))
+        item.setBackground(self.accent_brush)
+        item.setForeground(self.accent_text_brush)
+        self.highlighted_items.add(item)
 
         if update_qva:
             time = self.slider.value() / self.slider_scaling_factor
@@ -528,8 +630,9 @@ class QuadView(QMainWindow):
             self._view_model.deselect_item(item_path, backend_memory=self._view_model.selected_di_only_data)
 
         # Highlight item in the tree menu
-        item.setBackground(QColor(self.theme.highlight))
-        item.setForeground(QColor(self.theme.highlight_text))
+        item.setBackground(self.highlight_brush)
+        item.setForeground(self.highlight_text_brush)
+        self.highlighted_items.add(item)
 
         # Add plot
         ts, val, signal_name = self._view_model.get_signal_data(item_path)
@@ -549,14 +652,10 @@ class QuadView(QMainWindow):
         :param parent_key: The name of the parent item to be added (or updated) in the tree menu.
         :param child_keys: A list of child items to be added under the specified parent.
         """
-        model = self.tree_view.model()
-        if not model:
+        model = self.tree_model
+        if model is None:
             return
 
-        # If using a proxy model, get the source model
-        if hasattr(model, "sourceModel"):
-            model = model.sourceModel()
-
         # Find the parent tree item (traverse backwards as it is most likely new additions are at the end)
         parent_item = None
         for row in range(model.rowCount()-1, -1, -1):
@@ -587,24 +686,28 @@ class QuadView(QMainWindow):
         """ Called when a new file is loaded. Clears and refreshes the main window. """
         self.reset_ui_workspace()
 
-        tree_model = self._view_model.update_tree_model()
-        self.tree_view.setModel(tree_model)
+        # Keep the models at hand, instead of querying them from the tree view on every click
+        self.proxy_model = self._view_model.update_tree_model()
+        self.tree_model = self.proxy_model.sourceModel()
+        self.tree_view.setModel(self.proxy_model)
 
     def reset_ui_workspace(self):
         """ Function that clears all user UI related actions while keeping imported data intact. """
         if self._view_model.is_mat_loaded():
             self.clear_graph_view_plots()
             self.clear_tree_highlighting()
-            self.textbox_selected_signals.setPlainText("")
+            self.set_selected_signals_text("")
             self.di_text_item.setPlainText("")
             self._view_model.deselect_all_signals()
             self.cm.reset()
             self.global_ts_ref_bar.set_placeholder_text(self._view_model.get_current_ts_placeholder_text())
 
     def clear_graph_view_plots(self):
-        self.graph_ax.clear()
-        self.graph_plots = {}
-        self.graph_ax.addItem(self.vline)
+        # Removing every plot one by one would otherwise update the graph's range after each removal
+        with self.batched_plot_updates():
+            self.graph_ax.clear()
+            self.graph_plots = {}
+            self.graph_ax.addItem(self.vline)
         self.hard_reset_slider()
 
     def hard_reset_slider(self):
@@ -619,65 +722,40 @@ class QuadView(QMainWindow):
         self.vline.setValue(0)
 
     def clear_tree_highlighting(self):
-        """ Clears all highlighting from the tree view items. """
-        model = self.tree_view.model()
-        if not model:
-            return
-
-        # If using a proxy model, get the source model
-        if hasattr(model, "sourceModel"):
-            model = model.sourceModel()
-
-        # Start with the invisible root item
-        root = model.invisibleRootItem()
-        stack = [root]
-
+        """ Clears all highlighting from the tree view items, only the highlighted items are reset. """
         # Reset the item's background and foreground to the default theme
-        while stack:
-            item = stack.pop()
-            item.setBackground(QColor(self.theme.background))
-            item.setForeground(QColor(self.theme.text))
+        for item in self.highlighted_items:
+            item.setBackground(self.background_brush)
+            item.setForeground(self.text_brush)
 
-            # Push all children of this item onto the stack
-            for row in range(item.rowCount()):
-                child = item.child(row)
-                if child is not None:
-                    stack.append(child)
+        self.highlighted_items.clear()
 
     def dragEnterEvent(self, event: QDragEnterEvent, /):
         """ This event triggers when a file is being dragged into the main window """
-        if event.mimeData().hasUrls():
-            accept_drop = True
+        urls = event.mimeData().urls()
+        accepted_file_types = self._view_model.accepted_file_types
 
-            for url in event.mimeData().urls():
-                filepath = pathlib.Path(url.toLocalFile())
-
-                if filepath.suffix.lower() not in self._view_model.accepted_file_types:
-                    accept_drop = False
-                    break
-
-            if accept_drop:
-                event.accept()
-            else:
-                event.ignore()
+        # Only check the suffix of the path strings (stops at the first unsupported file), no Path objects for a drag
+        if urls and all(os.path.splitext(url.toLocalFile())[1].lower() in accepted_file_types for url in urls):
+            event.accept()
         else:
             event.ignore()
 
     def dropEvent(self, event):
         """ This event triggers when a file is dropped into the main window. Get filepath(s) and send to ViewModel. """
-        if event.mimeData().hasUrls():
-            accepted_files = []
+        accepted_file_types = self._view_model.accepted_file_types
 
-            for url in event.mimeData().urls():
-                filepath = pathlib.Path(url.toLocalFile())
-                if filepath.suffix.lower() in self._view_model.accepted_file_types:
-                    accepted_files.append(filepath)
+        # Only create Path objects for the accepted files
+        filepaths = (url.toLocalFile() for url in event.mimeData().urls())
+        accepted_files = [pathlib.Path(filepath) for filepath in filepaths
+                          if os.path.splitext(filepath)[1].lower() in accepted_file_types]
 
-            if accepted_files:
-                event.accept()  # Confirm that the drop was handled
+        if accepted_files:
+            event.accept()  # Confirm that the drop was handled
+
+            # Dropped files (e.g., configuration files) can add many plots at once
+            with self.batched_plot_updates():
                 self._view_model.handle_dropped_files(accepted_files)
-            else:
-                event.ignore()
         else:
             event.ignore()
 
@@ -16,6 +16,9 @@ from PySide6.QtGui import QStandardItem, QStandardItemModel
 # Internal imports
 from viewmodel.helpers.tree_menu_search_filter import CustomFilterProxyModel
 
+# Keys of the timestamps stored next to the signals in the backend-memory, i.e., not signals themselves
+SKIP_KEYS = frozenset(("ts", "ts_raw"))
+
 class QuadViewModel(QObject):
     # Signals are initialize here - Signal(args) need to match with the emit and the function it connects to
     signal_new_data_loaded = Signal()                                 # Notifies the View, that a new data file is loaded
@@ -34,7 +37,7 @@ class QuadViewModel(QObject):
         self.loaded_data = {}
         self.selected_signals_data = {}
         self.selected_di_only_data = {}
-        self.accepted_file_types = [".mat", ".dat", ".conf", ".py"]
+        self.accepted_file_types = frozenset((".mat", ".dat", ".conf", ".py"))  # Lowercase suffixes, frozenset[str]
         self._proxy_model = CustomFilterProxyModel()
         self.global_ts_ref = None
         self.loaded_ts_ref = None
@@ -247,11 +250,11 @@ class QuadViewModel(QObject):
             elif file_ext == ".py":
                 pyfiles.append(filepath)
 
-        # Update - important, always parse the .mat file first
-        if current_mat.is_file():
+        # Update - important, always parse the .mat file first (check the suffix first to skip the stat call if unset)
+        if current_mat.suffix == ".mat" and current_mat.is_file():
             self.set_and_load_mat(current_mat)
 
-        if current_dat.is_file():
+        if current_dat.suffix == ".dat" and current_dat.is_file():
             self.dat = current_dat
             self.update_video_file()
 
@@ -313,21 +316,21 @@ class QuadViewModel(QObject):
                 vline, _ = val
                 y = vline.getYPos()
             else:
-                # Get the index for the time that closest matches up with chosen reference time
-                x = val.getData()[0]
+                # Get the index for the time that closest matches up with chosen reference time. Use the original data,
+                # getData() returns the clipped and downsampled data that is displayed
+                x, y_data = val.getOriginalDataset()
                 idx = np.argmin(np.abs(x - ref_time))
-                y = val.getData()[1][idx]
+                y = y_data[idx]
 
             # Store
             di_dict[item_name] = y
 
-        skip_keys = ("ts", "ts_raw")
         for parent, item in self.selected_di_only_data.items():
             for child, val in item.items():
                 custom_items = isinstance(val, dict)
 
                 # Only check normal items, custom items are handled separately
-                if child in skip_keys and not custom_items:
+                if child in SKIP_KEYS and not custom_items:
                     continue
 
                 # Lazy handle duplicates
@@ -338,7 +341,7 @@ class QuadViewModel(QObject):
 
                 if custom_items:  # Handle custom items
                     for sub_key, sub_val in val.items():
-                        if sub_key in skip_keys:
+                        if sub_key in SKIP_KEYS:
                             continue
                         idx = np.argmin(np.abs(val["ts"] - ref_time))
                         y = sub_val[idx]
@@ -352,7 +355,6 @@ class QuadViewModel(QObject):
 
     def get_default_data_insight(self) -> str:
         """ Returns a formatted summary of selected signals that exists in the memory (excluding ts) at index 0. """
-        skip_keys = ("ts", "ts_raw")
         di_dict = {}
         merged_data = self._model.merge_dicts(self.selected_signals_data, self.selected_di_only_data)
         for parent, item in merged_data.items():
@@ -360,7 +362,7 @@ class QuadViewModel(QObject):
                 custom_items = isinstance(val, dict)
 
                 # Only check normal items, custom items are handled separately
-                if child in skip_keys and not custom_items:
+                if child in SKIP_KEYS and not custom_items:
                     continue
 
                 # Lazy handle duplicates
@@ -371,7 +373,7 @@ class QuadViewModel(QObject):
 
                 if custom_items:   # Handle custom items
                     for sub_key, sub_val in val.items():
-                        if sub_key in skip_keys:
+                        if sub_key in SKIP_KEYS:
                             continue
                         di_dict[item_name] = sub_val[0]
                 else: